@@ -29,6 +29,7 @@ Bring up help, functions, or definition file conveniently in the command line
 
 import sys
 import argparse
+import functools
 import pkgutil
 import importlib
 import subprocess
@@ -36,10 +37,17 @@ import inspect
 from types import ModuleType
 import webbrowser
 import http.client
+import json
+import threading
+import time
 import urllib.parse
 from pathlib import Path
 from typing import Any, Callable
 
+DOCS_CACHE_PATH = Path.home() / ".cache" / "pyman" / "docs_urls.json"
+DOCS_CACHE_TTL = 7 * 24 * 60 * 60  # Seconds
+DOCS_CHECK_TIMEOUT = 2  # Seconds
+
 def import_module(module_name: str) -> ModuleType | None:  # Return type for module?
     try:
         module = importlib.import_module(module_name)
@@ -50,9 +58,7 @@ def import_module(module_name: str) -> ModuleType | None:  # Return type for mod
 def module_partial_results(module_name) -> None:
     partial_results = module_partial_search(module_name)
     if len(partial_results) > 0:
-        print("Possible suggestions:")
-        for m in partial_results:
-            print(f"* {m}")
+        sys.stdout.write("Possible suggestions:\n" + "".join(f"* {m}\n" for m in partial_results))
         sys.exit()
     else:
         print("No matches found")
@@ -61,9 +67,7 @@ def module_partial_results(module_name) -> None:
 def member_partial_results(module: ModuleType | None, member_name: str) -> None:
     partial_results = member_partial_search(module, member_name)
     if len(partial_results) > 0:
-        print("Possible suggestions:")
-        for m in partial_results:
-            print(f"* {m}")
+        sys.stdout.write("Possible suggestions:\n" + "".join(f"* {m}\n" for m in partial_results))
         sys.exit()
     else:
         print("No matches found")
@@ -78,35 +82,34 @@ def get_module_functions(module_name: str, include_dunder: bool = False) -> list
         module_partial_results(module_name)
         # Could return an empty list instead?
     else:
-        attributes = dir(module)
+        # Not every callable has a __name__ (e.g. functools.partial), fall back to the attribute
         functions = [
-            getattr(module, attr).__name__ for attr in attributes 
-            if callable(getattr(module, attr))
-            
+            getattr(obj, "__name__", attr) for attr in dir(module)
+            if (include_dunder or not attr.startswith("_")) and callable(obj := getattr(module, attr))
         ]
-        if not include_dunder:
-            functions = [func for func in functions if not func.startswith("_")]
-            
         return functions
 
 def print_module_members(module_name: str) -> None:
     members = get_module_functions(module_name)
     if members:
-        for mem in members:
-            print(f"* {mem}")
+        sys.stdout.write("".join(f"* {mem}\n" for mem in members))
     
-def get_modules() -> list:
-    module_list = [x.name for x in list(pkgutil.iter_modules()) if not x.name.startswith("_")]
+@functools.cache
+def get_modules() -> frozenset[str]:
+    # iter_modules() walks every sys.path entry, so only do it once per run
+    module_list = frozenset(x.name for x in pkgutil.iter_modules() if not x.name.startswith("_"))
     return module_list
 
-def get_builtins() -> list:
-    return [x for x in dir(__builtins__) if not x.startswith("_")]
+@functools.cache
+def get_builtins() -> frozenset[str]:
+    return frozenset(x for x in dir(__builtins__) if not x.startswith("_"))
+
+@functools.cache
+def get_all_names() -> frozenset[str]:
+    return get_modules() | get_builtins()
 
 def module_partial_search(search_term: str) -> list[str]:
-    mods = get_modules()
-    builtin = get_builtins()
-    all_members = mods + builtin
-    matches = [m for m in all_members if m.startswith(search_term)]
+    matches = sorted(m for m in get_all_names() if m.startswith(search_term))
     return matches
 
 def member_partial_search(module: ModuleType | None, search_term: str) -> list[str]:
@@ -121,12 +124,10 @@ def search_all(search_term: str) -> str | None:
         return "module"
     elif search_term in builtin:
         return "builtin"
-    if len(module_partial_search(search_term)) > 0:
-        print("Possible suggestions:")
-        results = module_partial_search(search_term)
-        for m in results:
-            print(m)
-        return "partial"        
+    results = module_partial_search(search_term)
+    if results:
+        sys.stdout.write("Possible suggestions:\n" + "\n".join(results) + "\n")
+        return "partial"
 
 # --manual
 
@@ -195,14 +196,54 @@ def open_file_source(module_name: str, editor: str ="vim"):
 
 # --doc
 
-def check_docs_url(url: str):
+def load_docs_cache() -> dict:
+    # Unreadable or malformed cache files count as empty
+    try:
+        cache = json.loads(DOCS_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def save_docs_cache(cache: dict) -> None:
+    try:
+        DOCS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        DOCS_CACHE_PATH.write_text(json.dumps(cache))
+    except OSError:
+        # The cache is only an optimisation, never fail the lookup over it
+        pass
+
+@functools.cache
+def get_connection(netloc: str) -> http.client.HTTPSConnection:
+    return http.client.HTTPSConnection(netloc, timeout=DOCS_CHECK_TIMEOUT)
+
+def cached_docs_status(cache: dict, url: str) -> int | None:
+    try:
+        status, timestamp = cache[url]
+        if time.time() - timestamp < DOCS_CACHE_TTL:
+            return status
+    except (KeyError, TypeError, ValueError):
+        # Missing or malformed entry, treat as a cache miss
+        pass
+    return None
+
+def check_docs_url(url: str, cache: dict):
     parsed_url = urllib.parse.urlparse(url)
-    conn = http.client.HTTPSConnection(parsed_url.netloc)
+    conn = get_connection(parsed_url.netloc)
     conn.request("HEAD", parsed_url.path)
     response = conn.getresponse()
+    response.read()  # Drain so the connection can be reused
 
+    cache[url] = (response.status, time.time())
+    save_docs_cache(cache)
     return response.status
 
+def prefetch_docs_status(url: str, cache: dict) -> None:
+    try:
+        check_docs_url(url, cache)
+    except Exception:
+        # Nothing is waiting on the result, a failed check just isn't cached
+        pass
+
 def open_docs_page(module_name: str) -> None:
     """
     TODO: Jump to highlighted definition of a single function within the docs: 
@@ -216,17 +257,21 @@ def open_docs_page(module_name: str) -> None:
         sys.exit()
     else:
         url = f"https://docs.python.org/3/library/{module_name}.html"
-        # If URL = 404 response, don't open
-        try:
-            status = check_docs_url(url)
-            if status == 200:
-                webbrowser.open(url)
-            elif status == 404:
-                print(f"No documentation found for {module_name}")
-            else:
-                print(f"Received unexpected status code {status} for URL: {url}")
-        except Exception as e:
-            print(f"Error occurred: {e}")
+        # Only a known 404 stops the page opening, the browser handles anything else
+        cache = load_docs_cache()
+        status = cached_docs_status(cache, url)
+        if status == 404:
+            print(f"No documentation found for {module_name}")
+            return
+        thread = None
+        if status is None:
+            # Check the URL in the background so the result is cached for next time
+            thread = threading.Thread(target=prefetch_docs_status, args=(url, cache), daemon=True)
+            thread.start()
+        webbrowser.open(url)
+        if thread is not None:
+            # Give the check a bounded chance to finish, a daemon thread is dropped at exit
+            thread.join(DOCS_CHECK_TIMEOUT)
 
 def main():
     parser = argparse.ArgumentParser(prog="PyMan")
@@ -8,61 +8,65 @@ A collection of helpful commands for various linux topics.
 
 """
 
+import os
 import subprocess
 import sys
 import logging
 import argparse
-from pathlib import Path
 
 USER = "kyle"
-DIR = Path(f"/home/{USER}/.recipes/")
+DIR = f"/home/{USER}/.recipes"
 EDITOR = "vim"
 
-def init(dir_path: Path = DIR) -> None:
-    if not dir_path.exists():
-        Path.mkdir(dir_path)
-        print(f"No data directory was found, creting new at {str(DIR)}")
+def init(dir_path: str = DIR) -> None:
+    if not os.path.exists(dir_path):
+        os.mkdir(dir_path)
+        print(f"No data directory was found, creting new at {DIR}")
 
 
 def edit_recipe(recipe_name: str, editor_command: str = EDITOR) -> None:
-    recipe_path = DIR / f"{recipe_name}.txt"
-    if not recipe_path.exists():
+    recipe_path = os.path.join(DIR, recipe_name + ".txt")
+    if not os.path.exists(recipe_path):
         print(f"No recipe called '{recipe_name}' was found.")
         return
     subprocess.run([editor_command, recipe_path])
 
 
-def make_recipe(recipe_name: str, edit: bool = False, dir_path: Path = DIR) -> None:
-    recipe_path = dir_path / f"{recipe_name}.txt"
-    if recipe_path.exists():
+def make_recipe(recipe_name: str, edit: bool = False, dir_path: str = DIR) -> None:
+    recipe_path = os.path.join(dir_path, recipe_name + ".txt")
+    if os.path.exists(recipe_path):
         confirm = input(f"'{recipe_name}' file exists. Overwrite? Y/n ")
         if confirm != "Y":
             return
-    Path.touch(recipe_path)  # Create an empty file
+    with open(recipe_path, "a"):  # Create an empty file
+        pass
     if edit:  # Edit if optional arg supplied
         edit_recipe(recipe_name)
 
 
 def view_recipe(recipe_name: str) -> None:
-    recipe_path = DIR / f"{recipe_name}.txt"
+    recipe_path = os.path.join(DIR, recipe_name + ".txt")
     subprocess.run(["cat", recipe_path])
 
 
 def del_recipe(recipe_name: str) -> None:
-    recipe_path = DIR / f"{recipe_name}.txt"
-    if not recipe_path.exists():
+    recipe_path = os.path.join(DIR, recipe_name + ".txt")
+    if not os.path.exists(recipe_path):
         print(f"No recipe file found for '{recipe_name}'")
         return
     confirm = input(f"Are you sure you want to delete '{recipe_name}'? Y/n ")
     if confirm != "Y":
-        Path.unlink(recipe_path)
+        os.remove(recipe_path)
 
 
 def list_recipes():
-    print("--- Recipes ---\n")
-    for filename in sorted(DIR.iterdir()):
-        if filename.is_file():
-            print(f"* {filename.stem}")
+    # DirEntry.is_file() uses the cached d_type, no extra stat per file
+    with os.scandir(DIR) as it:
+        entries = [e for e in it if e.is_file()]
+    entries.sort(key=lambda e: e.name)
+    sys.stdout.write(
+        "--- Recipes ---\n\n" + "".join(f"* {os.path.splitext(e.name)[0]}\n" for e in entries)
+    )
     sys.exit(0)
 
 
@@ -7,72 +7,118 @@ Simple CLI utility to manage tasks. Useful if you spend your life in the command
 
 """
 
+import os
 import sys
 import argparse
+import json
 import pickle
-from pathlib import Path
+from collections import namedtuple
+from functools import cached_property
+from operator import attrgetter
 
 USER = "kyle"
-DATA_PATH = Path(f"/home/{USER}/.org/tasks.pkl")
+DATA_PATH = f"/home/{USER}/.org/tasks.jsonl"
+
+Task = namedtuple("Task", "id title priority")
 
 class TaskManager:
-    def __init__(self, data_path: Path = DATA_PATH):
-        self.data_path = data_path
-        self.tasks = self.load_tasks()
+    def __init__(self, data_path: str | os.PathLike = DATA_PATH):
+        self.data_path = os.fspath(data_path)
+
+    @cached_property
+    def tasks(self) -> dict[int, Task]:
+        """Tasks keyed by ID, loaded on first access."""
+        return {task.id: task for task in self.load_tasks()}
 
     def init(self):
         """Initialize the tasks file if it doesn't exist."""
-        if not self.data_path.parent.exists():
-            self.data_path.parent.mkdir(parents=True, exist_ok=True)
+        data_dir = os.path.dirname(self.data_path)
+        if data_dir and not os.path.exists(data_dir):
+            os.makedirs(data_dir, exist_ok=True)
         
-        if not self.data_path.exists():
+        if not os.path.exists(self.data_path):
+            # Creating an empty file here would hide an old pickle from load_tasks
+            self.migrate_legacy_tasks()
+        if not os.path.exists(self.data_path):
             print(f"No data file found, creating new at '{self.data_path}'")
             self.save_tasks([])
 
-    def load_tasks(self) -> list:
-        """Load tasks from pickle file."""
+    def load_tasks(self) -> list[Task]:
+        """Load tasks from the JSON lines file."""
+        tasks = []
         try:
-            if self.data_path.exists():
-                with open(self.data_path, 'rb') as f:
-                    return pickle.load(f)
-            return []
+            with open(self.data_path, 'r') as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    # A torn append only loses its own line, not the whole file
+                    try:
+                        tasks.append(Task(**json.loads(line)))
+                    except (json.JSONDecodeError, TypeError):
+                        print(f"Skipping unreadable task on line {line_no} of '{self.data_path}'")
+        except FileNotFoundError:
+            return self.migrate_legacy_tasks()
+        return tasks
+
+    def migrate_legacy_tasks(self) -> list[Task]:
+        """Convert tasks from the old pickle file, which is left in place."""
+        legacy_path = os.path.splitext(self.data_path)[0] + ".pkl"
+        try:
+            with open(legacy_path, 'rb') as f:
+                legacy_tasks = pickle.load(f)
         except (FileNotFoundError, pickle.UnpicklingError):
             return []
 
-    def save_tasks(self, tasks: list):
-        """Save tasks to pickle file."""
-        with open(self.data_path, 'wb') as f:
-            pickle.dump(tasks, f)
-
-    def sort_tasks(self, tasks: list[dict] = None) -> list:
+        tasks = {}
+        for task in legacy_tasks:
+            # Old IDs were len(tasks) + 1, so they can collide after a deletion
+            task_id = task['id'] if task['id'] not in tasks else max(tasks) + 1
+            tasks[task_id] = Task(task_id, task['title'], task['priority'])
+        self.save_tasks(tasks.values())
+        print(f"Migrated {len(tasks)} tasks from '{legacy_path}' to '{self.data_path}'")
+        return list(tasks.values())
+
+    def save_tasks(self, tasks):
+        """Rewrite the JSON lines file with all tasks."""
+        with open(self.data_path, 'w') as f:
+            f.writelines(json.dumps(task._asdict()) + "\n" for task in tasks)
+
+    def append_task(self, task: Task):
+        """Append a single task to the JSON lines file."""
+        line = json.dumps(task._asdict()) + "\n"
+        with open(self.data_path, 'a+b') as f:
+            # Start on a fresh line if a previous write was cut short
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = "\n" + line
+            f.write(line.encode())
+
+    def sort_tasks(self, tasks=None) -> list[Task]:
         """Sort tasks by priority (high to low)."""
         if tasks is None:
-            tasks = self.tasks
-        return sorted(tasks, key=lambda x: x['priority'], reverse=True)
+            tasks = self.tasks.values()
+        return sorted(tasks, key=attrgetter('priority'), reverse=True)
 
     def add_task(self, title: str, priority: int):
         """Add a new task."""
         if priority not in (1, 2, 3):
             raise ValueError("Priority is 1 = LOW, 2 = MEDIUM, 3 = HIGH")
         
-        task = {
-            "id": len(self.tasks) + 1,
-            "title": title,
-            "priority": priority
-        }
-        self.tasks.append(task)
-        self.save_tasks(self.tasks)
+        # IDs stay unique after deletions
+        task = Task(max(self.tasks, default=0) + 1, title, priority)
+        self.tasks[task.id] = task
+        self.append_task(task)
         print(f"Task added: {task}")
 
     def del_task(self, task_id: int):
         """Delete a task by ID."""
-        for i, task in enumerate(self.tasks):
-            if task['id'] == task_id:
-                deleted_task = self.tasks.pop(i)
-                self.save_tasks(self.tasks)
-                print(f"Deleted task: {deleted_task}")
-                return
-        print(f"No task found with ID {task_id}")
+        deleted_task = self.tasks.pop(task_id, None)
+        if deleted_task is None:
+            print(f"No task found with ID {task_id}")
+            return
+        self.save_tasks(self.tasks.values())
+        print(f"Deleted task: {deleted_task}")
 
     def view_tasks(self):
         """View all tasks."""
@@ -80,15 +126,15 @@ class TaskManager:
             print("No tasks found.")
             return
 
-        sorted_tasks = self.sort_tasks()
         print("Current Tasks:")
-        for task in sorted_tasks:
-            print(f"ID: {task['id']} | Priority: {task['priority']} | Title: {task['title']}")
+        for task in self.sort_tasks():
+            print(f"ID: {task.id} | Priority: {task.priority} | Title: {task.title}")
 
     def clear_tasks(self):
         """Clear all tasks."""
-        self.tasks = []
-        self.save_tasks(self.tasks)
+        # Truncate the file directly, there is nothing to load first
+        self.save_tasks([])
+        self.tasks = {}
         print("All tasks cleared.")
 
 def main():